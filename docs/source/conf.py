@@ -1,10 +1,9 @@
 import os
 import sys
-import platform
-import json
-import subprocess
 import pathlib
 import re
+import functools
+import types
 sys.path.insert(0, os.path.abspath('../..'))
 
 project = 'WRT (WebAssembly Runtime)'
@@ -40,62 +39,179 @@ current_version = os.environ.get('DOCS_VERSION', 'main')
 # The Dagger pipeline sets this to "/"
 version_path_prefix = os.environ.get('DOCS_VERSION_PATH_PREFIX', '/')
 
+# Repository root; conf.py lives in docs/source
+repo_root = pathlib.Path(__file__).resolve().parents[2]
+
+def _list_tags():
+    """Return the tag names of the repository without spawning git if possible."""
+    git_dir = repo_root / '.git'
+    if not git_dir.is_dir() or (git_dir / 'reftable').is_dir():
+        # Worktrees and submodules use a .git file pointing elsewhere, and the
+        # reftable backend keeps refs in binary tables; let git resolve those
+        import subprocess
+        result = subprocess.run(['git', 'tag'], cwd=repo_root, stdout=subprocess.PIPE, universal_newlines=True)
+        return result.stdout.split() if result.returncode == 0 else []
+
+    tags = set()
+    # Loose tags are files under refs/tags
+    tags_dir = git_dir / 'refs' / 'tags'
+    if tags_dir.is_dir():
+        for path in tags_dir.rglob('*'):
+            if path.is_file():
+                tags.add(path.relative_to(tags_dir).as_posix())
+    # Packed tags are "<sha> refs/tags/<name>" lines; '^' lines are peeled objects
+    packed_refs = git_dir / 'packed-refs'
+    if packed_refs.is_file():
+        for line in packed_refs.read_text().splitlines():
+            if line.startswith(('#', '^')):
+                continue
+            _, _, ref = line.partition(' ')
+            if ref.startswith('refs/tags/'):
+                tags.add(ref[len('refs/tags/'):])
+    return tags
+
+# Semantic version tags (x.y.z) that get an entry in the version switcher
+_SEMVER_RE = re.compile(r'^\d+\.\d+\.\d+$')
+
+# 'main' first, then tags in numeric order; the leading int keeps the keys
+# comparable (mixing a str and a list key raises TypeError)
+def _version_sort_key(v):
+    if v == 'main':
+        return (0, ())
+    return (1, tuple(int(x) for x in v.split('.')))
+
 # Function to get available versions
 def get_versions():
     versions = ['main']
     try:
-        # Get all tags
-        result = subprocess.run(['git', 'tag'], stdout=subprocess.PIPE, universal_newlines=True)
-        if result.returncode == 0:
-            # Only include semantic version tags (x.y.z)
-            tags = result.stdout.strip().split('\n')
-            for tag in tags:
-                if re.match(r'^\d+\.\d+\.\d+$', tag):
-                    versions.append(tag)
+        # Only include semantic version tags (x.y.z)
+        for tag in _list_tags():
+            if _SEMVER_RE.match(tag):
+                versions.append(tag)
     except Exception as e:
         print(f"Error getting versions: {e}")
     
-    return sorted(versions, key=lambda v: v if v == 'main' else [int(x) for x in v.split('.')])
+    return sorted(versions, key=_version_sort_key)
 
-# Available versions for the switcher
-versions = get_versions()
+def _versions_cache_key():
+    """Key for the cached version list: HEAD plus the mtimes of the tag refs."""
+    git_dir = repo_root / '.git'
+    try:
+        head = (git_dir / 'HEAD').read_text().strip()
+    except OSError:
+        return None
+    mtimes = []
+    # reftable rewrites tables.list whenever a ref changes
+    for ref_path in (git_dir / 'packed-refs', git_dir / 'refs' / 'tags', git_dir / 'reftable' / 'tables.list'):
+        try:
+            mtimes.append(ref_path.stat().st_mtime_ns)
+        except OSError:
+            mtimes.append(0)
+    return (head, *mtimes)
+
+def _get_cached_versions(env):
+    """Return the version list, reusing the one stored in the build environment."""
+    key = _versions_cache_key()
+    cache = getattr(env, 'wrt_versions_cache', {})
+    if key is not None and key in cache:
+        return cache[key]
+    result = get_versions()
+    if key is not None:
+        # Only the current key is worth keeping around
+        env.wrt_versions_cache = {key: result}
+    return result
+
+# Serialize to compact UTF-8 JSON bytes. orjson is used when installed;
+# json.dumps is configured to emit the exact same bytes so the write-if-changed
+# check below doesn't flip between environments with and without orjson.
+def _dump_json(data):
+    try:
+        import orjson
+    except ImportError:
+        import json
+        return json.dumps(data, separators=(',', ':'), ensure_ascii=False).encode()
+    return orjson.dumps(data)
+
+# Called on builder-inited so the version list can be cached in the pickled
+# BuildEnvironment and incremental builds don't have to ask git again.
+def publish_versions(app):
+    if docs_build_env_version.lower() == 'local':
+        # The switcher is meaningless for local builds; don't look at tags at all
+        versions = ['main']
+    else:
+        versions = _get_cached_versions(app.env)
 
-# Write versions data for the index page to use for redirection
-versions_data = {
-    'current_version': current_version,
-    'versions': versions,
-    'version_path_prefix': version_path_prefix
-}
+    # Write versions data for the index page to use for redirection
+    versions_data = {
+        'current_version': current_version,
+        'versions': versions,
+        'version_path_prefix': version_path_prefix
+    }
 
-# Ensure _static directory exists
-os.makedirs(os.path.join(os.path.dirname(__file__), '_static'), exist_ok=True)
+    # Ensure _static directory exists
+    static_dir = os.path.join(app.confdir, '_static')
+    if not os.path.isdir(static_dir):
+        os.makedirs(static_dir)
 
-# Write versions data to a JSON file
-with open(os.path.join(os.path.dirname(__file__), '_static', 'versions.json'), 'w') as f:
-    json.dump(versions_data, f)
+    # Write versions data to a JSON file, but only when the content changed so
+    # the file's mtime doesn't make Sphinx think the static files are outdated
+    versions_path = os.path.join(static_dir, 'versions.json')
+    payload = _dump_json(versions_data)
+    try:
+        with open(versions_path, 'rb') as f:
+            unchanged = f.read() == payload
+    except FileNotFoundError:
+        unchanged = False
+    if not unchanged:
+        with open(versions_path, 'wb') as f:
+            f.write(payload)
+
+    # Keep the list for add_versions_context; html_context itself stays as
+    # conf.py set it so the recorded config matches on the next build
+    app.env.wrt_versions = versions
+
+# Called on html-page-context: hand templates the real version list
+def add_versions_context(app, pagename, templatename, context, doctree):
+    context['versions'] = getattr(app.env, 'wrt_versions', html_context['versions'])
 
-# Add version data to the context for templates
+# Add version data to the context for templates; 'versions' is replaced
+# per page by add_versions_context once publish_versions has run
 html_context = {
     'current_version': current_version,
-    'versions': versions,
+    'versions': ['main'],
     'version_path_prefix': version_path_prefix
 }
 
+# Metadata returned by setup(). Sphinx discards the return value of conf.py's
+# setup(), so it has no effect on -j: only the metadata of the extensions
+# listed below decides whether reading and writing run in parallel.
+_SETUP_METADATA = {'version': '0.1'}
+
 # Custom monkeypatch to handle NoneType in names
 def setup(app):
+    # Watch-mode tools may hand the same app to setup() again; everything
+    # below only needs to be registered once per app
+    if getattr(app, '_wrt_setup_done', False):
+        return _SETUP_METADATA
+    app._wrt_setup_done = True
+
     from sphinx.domains.std import StandardDomain
-    old_process_doc = StandardDomain.process_doc
-    
-    def patched_process_doc(self, env, docname, document):
-        try:
-            return old_process_doc(self, env, docname, document)
-        except TypeError as e:
-            if "'NoneType' object is not subscriptable" in str(e):
-                print(f"WARNING: Caught TypeError in {docname}. This indicates a node with missing 'names' attribute.")
-                return
-            raise
-    
-    StandardDomain.process_doc = patched_process_doc
+    # The patch is applied to the class, so it must not stack up when
+    # several apps are created in one process
+    if not getattr(StandardDomain.process_doc, '_wrt_patched', False):
+        old_process_doc = StandardDomain.process_doc
+
+        def patched_process_doc(self, env, docname, document):
+            try:
+                return old_process_doc(self, env, docname, document)
+            except TypeError as e:
+                if "'NoneType' object is not subscriptable" in str(e):
+                    print(f"WARNING: Caught TypeError in {docname}. This indicates a node with missing 'names' attribute.")
+                    return
+                raise
+
+        patched_process_doc._wrt_patched = True
+        StandardDomain.process_doc = patched_process_doc
     
     # Add our custom CSS
     app.add_css_file('css/custom.css')
@@ -107,7 +223,41 @@ def setup(app):
     from sphinx_needs.api.configuration import add_dynamic_function
     add_dynamic_function(app, extract_reqs)
     
-    return {'version': '0.1', 'parallel_read_safe': True}
+    # Resolve the version switcher entries once the environment is loaded
+    app.connect('builder-inited', publish_versions)
+    app.connect('html-page-context', add_versions_context)
+
+    # Point sphinxcontrib.plantuml at the local PlantUML installation
+    app.connect('builder-inited', configure_plantuml)
+
+    # sphinxcontrib_rust generates the crates one after another; swap its
+    # builder-inited listener for one that runs them concurrently. Only do so
+    # if that listener is really there: the extension may be disabled, or a
+    # different version may hook in elsewhere.
+    rust_extension = app.extensions.get('sphinxcontrib_rust')
+    upstream_generate_docs = getattr(rust_extension and rust_extension.module, 'generate_docs', None)
+    replaced = False
+    for listener in list(app.events.listeners['builder-inited']):
+        if upstream_generate_docs is not None and listener.handler is upstream_generate_docs:
+            app.disconnect(listener.id)
+            replaced = True
+    if replaced:
+        app.connect('builder-inited', generate_rust_docs)
+    elif rust_extension is None:
+        # Commented out of extensions: nothing to generate, and not worth a
+        # warning that would fail -W builds
+        from sphinx.util import logging
+        logging.getLogger(__name__).info(
+            "[generate_rust_docs] sphinxcontrib_rust is not loaded; skipping Rust documentation"
+        )
+    else:
+        from sphinx.util import logging
+        logging.getLogger(__name__).warning(
+            "[generate_rust_docs] sphinxcontrib_rust.generate_docs is not connected to builder-inited; "
+            "leaving Rust documentation generation to sphinxcontrib_rust"
+        )
+
+    return _SETUP_METADATA
 
 extensions = [
     'sphinx.ext.autodoc',
@@ -171,40 +321,46 @@ plantuml = 'plantuml'
 plantuml_output_format = 'svg'
 plantuml_latex_output_format = 'pdf'
 
-# Make PlantUML work cross-platform
-if platform.system() == "Windows":
-    # Windows may need the full path to the plantuml.jar or plantuml.bat
-    plantuml = os.environ.get('PLANTUML_PATH', 'plantuml')
-elif platform.system() == "Darwin":  # macOS
-    # macOS typically uses Homebrew installation
-    plantuml = os.environ.get('PLANTUML_PATH', 'plantuml')
-    # Add debug info
-    print(f"PlantUML path on macOS: {plantuml}")
-    print(f"PlantUML exists: {os.path.exists(plantuml) if os.path.isabs(plantuml) else 'checking PATH'}")
-elif platform.system() == "Linux":
-    # Linux installation path
-    plantuml = os.environ.get('PLANTUML_PATH', 'plantuml')
+# Make PlantUML work cross-platform: Windows may need the full path to
+# plantuml.jar/plantuml.bat, macOS typically uses a Homebrew installation.
+# The command is only resolved on builder-inited (see configure_plantuml) so
+# the config value Sphinx records stays 'plantuml' and a different
+# PLANTUML_PATH between runs doesn't invalidate the whole HTML output.
+@functools.lru_cache(maxsize=None)
+def _plantuml_command():
+    command = os.environ.get('PLANTUML_PATH', 'plantuml')
+    import platform
+    if platform.system() == "Darwin":
+        # Add debug info
+        print(f"PlantUML path on macOS: {command}")
+        print(f"PlantUML exists: {os.path.exists(command) if os.path.isabs(command) else 'checking PATH'}")
+    return command
+
+def configure_plantuml(app):
+    # Leave a command given with sphinx-build -D plantuml=... alone
+    if app.config.plantuml == plantuml:
+        app.config.plantuml = _plantuml_command()
 
 # Allow customization through environment variables
 plantuml_output_format = os.environ.get('PLANTUML_FORMAT', 'svg')
 
 # Sphinx-needs configuration
 needs_types = [
-    dict(directive="req", title="Requirement", prefix="REQ_", color="#BFD8D2", style="node"),
-    dict(directive="spec", title="Specification", prefix="SPEC_", color="#FEDCD2", style="node"),
-    dict(directive="impl", title="Implementation", prefix="IMPL_", color="#DF744A", style="node"),
-    dict(directive="test", title="Test Case", prefix="T_", color="#DCB239", style="node"),
-    dict(directive="safety", title="Safety", prefix="SAFETY_", color="#FF5D73", style="node"),
-    dict(directive="qual", title="Qualification", prefix="QUAL_", color="#9370DB", style="node"),
-    dict(directive="constraint", title="Constraint", prefix="CNST_", color="#4682B4", style="node"),
-    dict(directive="panic", title="Panic", prefix="WRTQ_", color="#E74C3C", style="node"),
-    dict(directive="src",  title="Source file",  prefix="SRC_", color="#C6C6FF", style="node"),
+    {"directive": "req", "title": "Requirement", "prefix": "REQ_", "color": "#BFD8D2", "style": "node"},
+    {"directive": "spec", "title": "Specification", "prefix": "SPEC_", "color": "#FEDCD2", "style": "node"},
+    {"directive": "impl", "title": "Implementation", "prefix": "IMPL_", "color": "#DF744A", "style": "node"},
+    {"directive": "test", "title": "Test Case", "prefix": "T_", "color": "#DCB239", "style": "node"},
+    {"directive": "safety", "title": "Safety", "prefix": "SAFETY_", "color": "#FF5D73", "style": "node"},
+    {"directive": "qual", "title": "Qualification", "prefix": "QUAL_", "color": "#9370DB", "style": "node"},
+    {"directive": "constraint", "title": "Constraint", "prefix": "CNST_", "color": "#4682B4", "style": "node"},
+    {"directive": "panic", "title": "Panic", "prefix": "WRTQ_", "color": "#E74C3C", "style": "node"},
+    {"directive": "src", "title": "Source file", "prefix": "SRC_", "color": "#C6C6FF", "style": "node"},
     # Architecture-specific types
-    dict(directive="arch_component", title="Architectural Component", prefix="ARCH_COMP_", color="#FF6B6B", style="node"),
-    dict(directive="arch_interface", title="Interface", prefix="ARCH_IF_", color="#4ECDC4", style="node"),
-    dict(directive="arch_decision", title="Design Decision", prefix="ARCH_DEC_", color="#45B7D1", style="node"),
-    dict(directive="arch_constraint", title="Design Constraint", prefix="ARCH_CON_", color="#96CEB4", style="node"),
-    dict(directive="arch_pattern", title="Design Pattern", prefix="ARCH_PAT_", color="#FECA57", style="node"),
+    {"directive": "arch_component", "title": "Architectural Component", "prefix": "ARCH_COMP_", "color": "#FF6B6B", "style": "node"},
+    {"directive": "arch_interface", "title": "Interface", "prefix": "ARCH_IF_", "color": "#4ECDC4", "style": "node"},
+    {"directive": "arch_decision", "title": "Design Decision", "prefix": "ARCH_DEC_", "color": "#45B7D1", "style": "node"},
+    {"directive": "arch_constraint", "title": "Design Constraint", "prefix": "ARCH_CON_", "color": "#96CEB4", "style": "node"},
+    {"directive": "arch_pattern", "title": "Design Pattern", "prefix": "ARCH_PAT_", "color": "#FECA57", "style": "node"},
 ]
 
 # Add ID regex pattern for sphinx-needs
@@ -252,17 +408,17 @@ needs_templates = {
 
 # Tags for filtering and displaying panic entries
 needs_tags = [
-    dict(name="panic", description="Panic documentation entry", bgcolor="#E74C3C"),
-    dict(name="low", description="Low safety impact", bgcolor="#2ECC71"),
-    dict(name="medium", description="Medium safety impact", bgcolor="#F39C12"),
-    dict(name="high", description="High safety impact", bgcolor="#E74C3C"),
-    dict(name="unknown", description="Unknown safety impact", bgcolor="#95A5A6"),
+    {"name": "panic", "description": "Panic documentation entry", "bgcolor": "#E74C3C"},
+    {"name": "low", "description": "Low safety impact", "bgcolor": "#2ECC71"},
+    {"name": "medium", "description": "Medium safety impact", "bgcolor": "#F39C12"},
+    {"name": "high", "description": "High safety impact", "bgcolor": "#E74C3C"},
+    {"name": "unknown", "description": "Unknown safety impact", "bgcolor": "#95A5A6"},
     # Architecture tags
-    dict(name="core", description="Core architecture component", bgcolor="#FF6B6B"),
-    dict(name="portability", description="Multi-platform portability", bgcolor="#4ECDC4"),
-    dict(name="safety", description="Safety-critical component", bgcolor="#FF5D73"),
-    dict(name="performance", description="Performance-critical component", bgcolor="#FECA57"),
-    dict(name="testing", description="Testing and verification", bgcolor="#96CEB4"),
+    {"name": "core", "description": "Core architecture component", "bgcolor": "#FF6B6B"},
+    {"name": "portability", "description": "Multi-platform portability", "bgcolor": "#4ECDC4"},
+    {"name": "safety", "description": "Safety-critical component", "bgcolor": "#FF5D73"},
+    {"name": "performance", "description": "Performance-critical component", "bgcolor": "#FECA57"},
+    {"name": "testing", "description": "Testing and verification", "bgcolor": "#96CEB4"},
 ]
 
 # Configure needs roles for referencing 
@@ -275,16 +431,27 @@ needs_file_pattern = '**/*.rst'
 
 # New extra links configuration
 needs_extra_links = [
-    dict(
-        option   = "realizes",
-        incoming = "is realized by",
-        outgoing = "realizes",
-        style    = "solid,#006A6A",
-    ),
+    {
+        "option":   "realizes",
+        "incoming": "is realized by",
+        "outgoing": "realizes",
+        "style":    "solid,#006A6A",
+    },
 ]
 
 # Regular expression for finding requirement IDs
-REQ_RE = re.compile(r"SW-REQ-ID\\s*:\\s*(REQ_\\w+)", re.I)
+# IDs are ASCII-only so the str, bytes (mmap) and ripgrep scans all agree on
+# where an ID ends
+REQ_RE = re.compile(r"SW-REQ-ID\s*:\s*(REQ_\w+)", re.I | re.ASCII)
+# Same pattern for scanning memory-mapped files without decoding them
+REQ_RE_BYTES = re.compile(REQ_RE.pattern.encode(), REQ_RE.flags)
+
+# Guard against the pattern silently matching nothing again
+if os.environ.get('WRT_DOCS_SELFTEST'):
+    assert REQ_RE.findall("SW-REQ-ID: REQ_FOO") == ["REQ_FOO"]
+    assert REQ_RE_BYTES.findall(b"SW-REQ-ID: REQ_FOO") == [b"REQ_FOO"]
+    assert REQ_RE.findall("SW-REQ-ID: REQ_FOO\u00e9") == ["REQ_FOO"]
+    assert REQ_RE_BYTES.findall("SW-REQ-ID: REQ_FOO\u00e9".encode()) == [b"REQ_FOO"]
 
 # Initialize source_suffix before attempting to modify it
 source_suffix = {
@@ -308,6 +475,24 @@ else: # if it's a single string or not set as expected
         '.md': 'markdown',
     }
 
+# Files bigger than this are memory-mapped instead of read into a str
+_MMAP_MIN_SIZE = 64 * 1024
+
+# Requirement IDs of a single source file. Needs pointing at the same file
+# share the result; the mtime is part of the key so edits are picked up.
+@functools.lru_cache(maxsize=4096)
+def _scan_file(path, mtime_ns):
+    if os.path.getsize(path) > _MMAP_MIN_SIZE:
+        # Large (mostly generated) files: let the regex run over the mapped
+        # bytes and only decode the matched IDs, which are ASCII by construction
+        import mmap
+        with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            ids = [m.decode('ascii') for m in REQ_RE_BYTES.findall(mm)]
+    else:
+        text = pathlib.Path(path).read_text(errors="ignore")
+        ids  = REQ_RE.findall(text)
+    return ";".join(sorted(set(ids)))  # needs wants ';' as separator
+
 # Dynamic function to extract requirement IDs from a file
 def extract_reqs(app, need, needs, *args, **kwargs):
     """
@@ -324,10 +509,14 @@ def extract_reqs(app, need, needs, *args, **kwargs):
     # So, Path(app.confdir) / relative_file_path_from_doc_source gives the absolute path.
     absolute_src_file_path = (pathlib.Path(app.confdir) / relative_file_path_from_doc_source).resolve()
     
+    # All Rust sources are scanned together the first time a need asks
+    req_index = _get_req_index(app)
+    if str(absolute_src_file_path) in req_index:
+        return req_index[str(absolute_src_file_path)]
+
     try:
-        text = absolute_src_file_path.read_text(errors="ignore")
-        ids  = REQ_RE.findall(text)
-        return ";".join(sorted(set(ids)))  # needs wants ';' as separator
+        mtime_ns = absolute_src_file_path.stat().st_mtime_ns
+        return _scan_file(str(absolute_src_file_path), mtime_ns)
     except FileNotFoundError:
         print(f"WARNING: [extract_reqs] File not found: {absolute_src_file_path} (original path in need: {relative_file_path_from_doc_source})")
         return ""
@@ -335,6 +524,102 @@ def extract_reqs(app, need, needs, *args, **kwargs):
         print(f"ERROR: [extract_reqs] Could not read file {absolute_src_file_path}: {e}")
         return ""
 
+# Directories that never hold sources with requirement IDs
+_REQ_SCAN_SKIP_DIRS = {'target', 'node_modules', '_build'}
+
+def _find_rust_files(root):
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if d not in _REQ_SCAN_SKIP_DIRS and not d.startswith('.')]
+        for name in filenames:
+            if name.endswith('.rs'):
+                yield os.path.join(dirpath, name)
+
+def _index_file(path):
+    """Return (path, ids), or (path, None) if the file can't be read.
+
+    Unreadable files (broken symlinks, permissions, deleted mid-walk) are left
+    out of the index so extract_reqs reports them if a need points at one.
+    """
+    try:
+        return path, _scan_file(path, os.stat(path).st_mtime_ns)
+    except OSError:
+        return path, None
+
+def _rg_req_ids(root):
+    """Collect {path: set(ids)} with one ripgrep run; None if rg can't be used."""
+    import shutil
+    import subprocess
+    rg = shutil.which('rg')
+    if rg is None:
+        return None
+    # Mirror _find_rust_files and the Python regex: hidden files are searched
+    # but hidden directories are pruned, and \s* may span line breaks
+    args = [rg, '--no-ignore', '--hidden', '--multiline', '--null', '--no-heading', '--with-filename',
+            '--no-line-number', '--only-matching', '--ignore-case', '--no-unicode', '--replace', '$1',
+            '--glob', '*.rs', '--glob', '!.*/']
+    for skip_dir in sorted(_REQ_SCAN_SKIP_DIRS):
+        args += ['--glob', f'!{skip_dir}/']
+    args += ['--regexp', REQ_RE.pattern, str(root)]
+    result = subprocess.run(args, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    # Exit status 1 just means nothing matched
+    if result.returncode not in (0, 1):
+        print(f"WARNING: [index_reqs] ripgrep failed, scanning files directly: {result.stderr.decode(errors='replace')}")
+        return None
+    ids = {}
+    for line in result.stdout.splitlines():
+        path, _, req_id = line.partition(b'\0')
+        ids.setdefault(os.fsdecode(path), set()).add(req_id.decode('ascii', errors='replace'))
+    return ids
+
+# Scan every Rust source of the workspace once so extract_reqs only needs a
+# dict lookup per need instead of a read + regex. A single ripgrep pass is
+# used when rg is on PATH.
+def index_reqs():
+    paths = list(_find_rust_files(repo_root))
+    rg_ids = _rg_req_ids(repo_root)
+    if rg_ids is None:
+        import concurrent.futures
+        with concurrent.futures.ThreadPoolExecutor() as executor:
+            return {path: ids for path, ids in executor.map(_index_file, paths) if ids is not None}
+    # Leave unreadable files out of the index like _index_file does (rg
+    # reports them with exit status 2, which already falls back above, but a
+    # file may change in between). rg doesn't follow symlinked files, which
+    # the walker lists, so scan those directly.
+    req_index = {}
+    for path in paths:
+        if os.path.islink(path):
+            path, ids = _index_file(path)
+            if ids is not None:
+                req_index[path] = ids
+        elif os.path.isfile(path) and os.access(path, os.R_OK):
+            req_index[path] = ";".join(sorted(rg_ids.get(path, ())))
+    return req_index
+
+# The index is built on first use, so builds without extract_reqs needs don't
+# pay for the workspace scan. It is kept on the app rather than the
+# environment: it is rebuilt every run anyway and must not be pickled. Once
+# built it is read-only, so extract_reqs can't make processes disagree.
+def _get_req_index(app):
+    req_index = getattr(app, '_wrt_req_index', None)
+    if req_index is None:
+        from sphinx.util import logging
+        from sphinx.util.build_phase import BuildPhase
+        if app.phase == BuildPhase.READING:
+            # Parallel readers would each build (and then drop) their own index
+            logging.getLogger(__name__).warning(
+                "[extract_reqs] requirement index requested while reading documents; "
+                "every reader process scans the workspace on its own"
+            )
+        if docs_build_env_version.lower() == 'local':
+            # Not worth a full workspace scan for local builds; extract_reqs
+            # then reads (and caches) just the files needs actually point at
+            req_index = {}
+        else:
+            req_index = index_reqs()
+        req_index = types.MappingProxyType(req_index)
+        app._wrt_req_index = req_index
+    return req_index
+
 # Configuration to make specific strings in RST linkable
 needs_string_links = {
     # Link REQ_XXX to its definition
@@ -391,4 +676,56 @@ rust_doc_dir = "_generated_rust_docs"
 
 # Assuming Rust doc comments are written in Markdown.
 # If they are in reStructuredText, this can be set to "rst" or omitted (default).
-rust_rustdoc_fmt = "md"
\ No newline at end of file
+rust_rustdoc_fmt = "md"
+
+# Number of crates documented concurrently: RUST_DOC_JOBS if it is a positive
+# integer, otherwise one per CPU
+def _rust_doc_jobs(logger):
+    default_jobs = os.cpu_count() or 4
+    value = os.environ.get('RUST_DOC_JOBS')
+    if value is None:
+        return default_jobs
+    try:
+        jobs = int(value)
+    except ValueError:
+        jobs = 0
+    if jobs < 1:
+        logger.warning(f"[generate_rust_docs] Invalid RUST_DOC_JOBS={value!r}, using {default_jobs}")
+        return default_jobs
+    return jobs
+
+# Parallel version of sphinxcontrib_rust.generate_docs: every crate is an
+# independent sphinx-rustdocgen process writing to its own directory, so they
+# can run side by side. RUST_DOC_JOBS limits the number of concurrent crates.
+def generate_rust_docs(app):
+    import concurrent.futures
+    import json
+    import subprocess
+    from dataclasses import asdict
+    from sphinx.util import logging
+    from sphinxcontrib_rust import CrateConfiguration
+
+    # Report through Sphinx like upstream does, so failures count as build
+    # errors (-W, --keep-going, warning totals)
+    logger = logging.getLogger(__name__)
+    executable, crate_configs = CrateConfiguration.from_sphinx_config(app.config)
+    jobs = _rust_doc_jobs(logger)
+
+    def generate_crate(crate_config):
+        logger.info(f"[sphinxcontrib_rust] Processing crate {crate_config.crate_name} from {crate_config.crate_dir}")
+        try:
+            subprocess.run(
+                [executable, json.dumps(asdict(crate_config))],
+                check=True,
+                text=True,
+                capture_output=True,
+            )
+        except subprocess.CalledProcessError as e:
+            logger.error(
+                f"[generate_rust_docs] sphinx-rustdocgen failed for {crate_config.crate_name} "
+                f"(exit status {e.returncode})\n"
+                f"=== Captured stderr ===\n{e.stderr}\n=== Captured stdout ===\n{e.stdout}"
+            )
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=jobs) as executor:
+        list(executor.map(generate_crate, crate_configs.values()))
@@ -356,8 +356,11 @@ fn generate_sphinx_docs_with_output(output_dir: Option<&String>) -> BuildResult<
             BuildError::Build(format!("Failed to create documentation directory: {}", e))
         })?;
 
+        // The docs extensions are parallel safe; doctrees are kept for incremental builds
         let mut cmd = Command::new(sphinx_cmd);
         cmd.args([
+            "-j",
+            "auto",
             "-b",
             "html",
             "-d",